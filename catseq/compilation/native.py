@@ -18,7 +18,6 @@ import hashlib
 from typing import Any
 
 from ..targets import rtmq_v2_profile
-from .execution import decode_oasm_call_plan
 from .types import OASMAddress, OASMCall
 
 
@@ -53,6 +52,9 @@ class OASMCompileResult:
     ) -> dict[OASMAddress, list[OASMCall]]:
         """Decode this plan into calls accepted by the existing OASM assembler."""
 
+        # The decoder pulls in the OASM assembler; keep it off the import path.
+        from .execution import decode_oasm_call_plan
+
         return decode_oasm_call_plan(
             self.oasm_call_plan,
             opaque_callables=opaque_callables,
@@ -68,7 +68,7 @@ class OASMFunction(Enum):
     RSP_PID_RELINK = auto()
     RSP_RF_CONFIG = auto()
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OASMCall:
     """OASM 调用对象 - 表示一个 seq() 调用"""
     adr: OASMAddress           # 目标地址
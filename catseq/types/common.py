@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 
@@ -31,16 +31,22 @@ class Channel:
     board: Board
     local_id: int
     channel_type: ChannelType
+    _global_id: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.local_id < 0:
             raise ValueError(
                 f"Channel local_id must be non-negative, got {self.local_id}"
             )
+        object.__setattr__(
+            self,
+            "_global_id",
+            f"{self.board.id}_{self.channel_type.name}_{self.local_id}",
+        )
 
     @property
     def global_id(self) -> str:
-        return f"{self.board.id}_{self.channel_type.name}_{self.local_id}"
+        return self._global_id
 
     def __str__(self) -> str:
         return self.global_id
@@ -6,7 +6,7 @@ class RSPState(State):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSPUninitialized(RSPState):
     offset_0: float = 0.0
     offset_1: float = 0.0
@@ -14,20 +14,20 @@ class RSPUninitialized(RSPState):
     chn_cpl: str = 'dd'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSPWaveformParams:
     rf_out: int # RF0/RF1
     amp: float # 0.0 ~ 1.0
     output_max: float | None = 0.01
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSPReady(RSPState):
     carrier_freq: float 
     static_rf: RSPWaveformParams | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSPPIDConfig:
     adc_in: int      # AI0/AI1
     rf_out: int      # RF0/RF1
@@ -40,13 +40,13 @@ class RSPPIDConfig:
     # 可继续加：sign, filter, dgt source, ckg source, units
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSPPIDReady(RSPState):
     carrier_freq: float 
     config: RSPPIDConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSPPIDActive(RSPState):
     carrier_freq: float 
     config: RSPPIDConfig
@@ -251,3 +251,14 @@ def test_compile_entry_reports_native_diagnostics(
             source_root=Path(__file__).parents[3],
             compiler="catseqc-test",
         )
+
+
+def test_importing_native_does_not_load_oasm() -> None:
+    script = """
+import sys
+import catseq.compilation.native
+assert 'oasm' not in sys.modules, sorted(
+    name for name in sys.modules if name.split('.', 1)[0] == 'oasm'
+)
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,33 @@
+from dataclasses import replace
+
+from catseq.types import Board, Channel, ChannelType
+
+
+def test_channel_identity_ignores_the_cached_global_id() -> None:
+    channel = Channel(Board("rwg0"), 2, ChannelType.RWG)
+    same = Channel(Board("rwg0"), local_id=2, channel_type=ChannelType.RWG)
+
+    assert channel == same
+    assert hash(channel) == hash(same)
+    assert channel != Channel(Board("rwg0"), 3, ChannelType.RWG)
+    assert repr(channel) == (
+        "Channel(board=Board(id='rwg0'), local_id=2, "
+        "channel_type=<ChannelType.RWG: 2>)"
+    )
+
+
+def test_channel_global_id_is_its_string_form() -> None:
+    channel = Channel(Board("main"), 5, ChannelType.TTL)
+
+    assert channel.global_id == "main_TTL_5"
+    assert str(channel) == "main_TTL_5"
+
+
+def test_replaced_channel_recomputes_its_global_id() -> None:
+    channel = Channel(Board("rwg0"), 0, ChannelType.TTL)
+
+    moved = replace(channel, local_id=4)
+
+    assert moved.global_id == "rwg0_TTL_4"
+    assert str(moved) == "rwg0_TTL_4"
+    assert channel.global_id == "rwg0_TTL_0"